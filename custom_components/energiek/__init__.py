@@ -2,23 +2,32 @@
 from __future__ import annotations
 
 import logging
+import time
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .const import DATA_API, DATA_COORDINATOR, DOMAIN
+from .const import (
+    CONF_PRICE_THRESHOLD,
+    DATA_API,
+    DATA_COORDINATOR,
+    DATA_THRESHOLD,
+    DOMAIN,
+)
 from .coordinator import EnergiekDataUpdateCoordinator
 from .energiek_api import EnergiekAPI, AuthException
+from .threshold import PriceThresholdScheduler
 
-PLATFORMS = ["sensor", "binary_sensor"]
+PLATFORMS = ["sensor", "binary_sensor", "calendar"]
 
 _LOGGER = logging.getLogger(__name__)
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Energiek from a config entry."""
+    started = time.monotonic()
     email = entry.data[CONF_EMAIL]
     password = entry.data[CONF_PASSWORD]
 
@@ -37,14 +46,25 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     await coordinator.async_config_entry_first_refresh()
 
+    threshold = None
+    if entry.options.get(CONF_PRICE_THRESHOLD) is not None:
+        threshold = PriceThresholdScheduler(hass, entry, coordinator)
+        threshold.async_update()
+        entry.async_on_unload(coordinator.async_add_listener(threshold.async_update))
+        entry.async_on_unload(threshold.async_cancel)
+
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = {
         DATA_API: api,
         DATA_COORDINATOR: coordinator,
+        DATA_THRESHOLD: threshold,
     }
 
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    _LOGGER.debug("Set up Energiek in %.3f seconds", time.monotonic() - started)
     return True
 
 
@@ -53,7 +73,11 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
         data = hass.data[DOMAIN].pop(entry.entry_id)
-        api = data[DATA_API]
-        await api.__aexit__(None, None, None)
+        await data[DATA_API].close()
 
     return unload_ok
+
+
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the config entry when its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
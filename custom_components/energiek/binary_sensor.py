@@ -7,11 +7,13 @@ from homeassistant.components.binary_sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DATA_COORDINATOR, DOMAIN
+from .const import DATA_COORDINATOR, DATA_THRESHOLD, DOMAIN
 from .coordinator import EnergiekDataUpdateCoordinator
 from .sensor import EnergiekSensorBase
+from .threshold import PriceThresholdScheduler
 
 
 async def async_setup_entry(
@@ -23,8 +25,15 @@ async def async_setup_entry(
     coordinator: EnergiekDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id][
         DATA_COORDINATOR
     ]
+    threshold: PriceThresholdScheduler | None = hass.data[DOMAIN][entry.entry_id][
+        DATA_THRESHOLD
+    ]
+
+    entities = [EnergiekTomorrowStatusSensor(coordinator)]
+    if threshold is not None:
+        entities.append(EnergiekPriceBelowThresholdSensor(coordinator, threshold))
 
-    async_add_entities([EnergiekTomorrowStatusSensor(coordinator)])
+    async_add_entities(entities)
 
 
 class EnergiekTomorrowStatusSensor(EnergiekSensorBase, BinarySensorEntity):
@@ -44,3 +53,44 @@ class EnergiekTomorrowStatusSensor(EnergiekSensorBase, BinarySensorEntity):
     def is_on(self) -> bool:
         """Return true if tomorrow's prices are available."""
         return self.coordinator.data.get("tomorrow_available", False)
+
+
+class EnergiekPriceBelowThresholdSensor(EnergiekSensorBase, BinarySensorEntity):
+    """Sensor that is on while the electricity price is below the threshold.
+
+    State changes are driven by the threshold scheduler's timers, not by
+    polling the current price.
+    """
+
+    _attr_name = "Electricity Price Below Threshold"
+    _attr_icon = "mdi:cash-clock"
+    _attr_has_entity_name = False
+
+    def __init__(
+        self,
+        coordinator: EnergiekDataUpdateCoordinator,
+        threshold: PriceThresholdScheduler,
+    ) -> None:
+        """Initialize the threshold sensor."""
+        super().__init__(coordinator)
+        self.threshold = threshold
+        self._attr_unique_id = f"{coordinator.entry.entry_id}_electricity_below_threshold"
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to threshold crossings."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass, self.threshold.signal, self.async_write_ha_state
+            )
+        )
+
+    @property
+    def is_on(self) -> bool | None:
+        """Return true if the price is below the threshold."""
+        return self.threshold.is_below
+
+    @property
+    def extra_state_attributes(self) -> dict[str, any]:
+        """Return extra state attributes."""
+        return {"threshold": self.threshold.threshold}
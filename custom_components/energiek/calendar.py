@@ -0,0 +1,237 @@
+"""Calendars of cheap and expensive periods for the Energiek integration."""
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable
+from datetime import datetime, timedelta
+import logging
+import operator
+from statistics import quantiles
+
+from homeassistant.components.calendar import CalendarEntity, CalendarEvent
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+import homeassistant.util.dt as dt_util
+
+from .const import (
+    CONF_CHEAP_PERCENTILE,
+    CONF_CHEAP_PRICE,
+    CONF_EXPENSIVE_PERCENTILE,
+    CONF_EXPENSIVE_PRICE,
+    DATA_COORDINATOR,
+    DEFAULT_CHEAP_PERCENTILE,
+    DEFAULT_EXPENSIVE_PERCENTILE,
+    DOMAIN,
+)
+from .coordinator import QUARTER, EnergiekDataUpdateCoordinator, PriceData
+from .sensor import EnergiekSensorBase
+
+_LOGGER = logging.getLogger(__name__)
+
+# Returns the (inclusive) price cutoff for the local day starting at the given time.
+CutoffFunc = Callable[[PriceData, datetime, datetime], float | None]
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up Energiek calendars."""
+    coordinator: EnergiekDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id][
+        DATA_COORDINATOR
+    ]
+
+    async_add_entities(
+        [
+            EnergiekPeriodCalendar(
+                coordinator,
+                key="cheap",
+                name="Cheap Electricity",
+                icon="mdi:cash-minus",
+                cutoff=_cutoff(
+                    entry.options.get(CONF_CHEAP_PRICE),
+                    entry.options.get(CONF_CHEAP_PERCENTILE, DEFAULT_CHEAP_PERCENTILE),
+                ),
+                qualifies=operator.le,
+            ),
+            EnergiekPeriodCalendar(
+                coordinator,
+                key="expensive",
+                name="Expensive Electricity",
+                icon="mdi:cash-plus",
+                cutoff=_cutoff(
+                    entry.options.get(CONF_EXPENSIVE_PRICE),
+                    entry.options.get(
+                        CONF_EXPENSIVE_PERCENTILE, DEFAULT_EXPENSIVE_PERCENTILE
+                    ),
+                ),
+                qualifies=operator.ge,
+            ),
+        ]
+    )
+
+
+def _cutoff(price: float | None, percentile: int) -> CutoffFunc:
+    """Return an absolute cutoff if configured, else a per-day percentile."""
+    if price is not None:
+        return lambda data, start, end: price
+
+    def _percentile(data: PriceData, start: datetime, end: datetime) -> float | None:
+        values = [
+            p["price"] for p in data.prices_between(start, end) if p["price"] is not None
+        ]
+        if len(values) < 2:
+            return values[0] if values else None
+        return quantiles(values, n=100, method="inclusive")[percentile - 1]
+
+    return _percentile
+
+
+def build_periods(
+    data: PriceData,
+    cutoff: CutoffFunc,
+    qualifies: Callable[[float, float], bool],
+) -> list[tuple[datetime, datetime, float]]:
+    """Merge consecutive qualifying quarter-hours into (start, end, mean price) periods."""
+    periods: list[tuple[datetime, datetime, float]] = []
+    run: list[dict] = []
+
+    def _close() -> None:
+        if run:
+            mean = sum(p["price"] for p in run) / len(run)
+            periods.append((run[0]["from"], run[-1]["from"] + QUARTER, mean))
+            run.clear()
+
+    for day in data.daily_mean:
+        start = day["from"]
+        end = dt_util.as_utc(dt_util.as_local(start) + timedelta(days=1))
+        limit = cutoff(data, start, end)
+        for p in data.prices_between(start, end):
+            if limit is None or p["price"] is None or not qualifies(p["price"], limit):
+                _close()
+                continue
+            if run and run[-1]["from"] + QUARTER != p["from"]:
+                _close()
+            run.append(p)
+    _close()
+    return periods
+
+
+def clip_to_wall_clock(
+    data: PriceData, periods: list[tuple[datetime, datetime, float]]
+) -> list[tuple[datetime, datetime, float]]:
+    """Clip periods that end "before" they start on the local wall clock.
+
+    Home Assistant validates events on the wall clock, which runs back during
+    the repeated hour of the autumn DST change. Such a period is shown from
+    the second occurrence of that hour on.
+    """
+    shown: list[tuple[datetime, datetime, float]] = []
+    for start, end, mean in periods:
+        local_start = dt_util.as_local(start)
+        if dt_util.as_local(end) >= local_start:
+            shown.append((start, end, mean))
+            continue
+        clipped = dt_util.as_utc(local_start.replace(minute=0, fold=1))
+        values = [
+            p["price"] for p in data.prices_between(clipped, end) if p["price"] is not None
+        ]
+        _LOGGER.debug(
+            "Clipping period %s - %s to start at %s for the DST change",
+            local_start,
+            dt_util.as_local(end),
+            dt_util.as_local(clipped),
+        )
+        if values:
+            shown.append((clipped, end, sum(values) / len(values)))
+    return shown
+
+
+class PeriodIndex:
+    """Sorted, non-overlapping periods answering range queries by bisection."""
+
+    def __init__(self, periods: list[tuple[datetime, datetime, float]]) -> None:
+        """Initialize the index."""
+        self.periods = periods
+        self._starts = [start for start, _, _ in periods]
+        self._ends = [end for _, end, _ in periods]
+
+    def between(
+        self, start: datetime, end: datetime
+    ) -> list[tuple[datetime, datetime, float]]:
+        """Return the periods overlapping [start, end)."""
+        lo = bisect_right(self._ends, start)
+        hi = bisect_left(self._starts, end, lo=lo)
+        return self.periods[lo:hi]
+
+    def next_after(self, when: datetime) -> tuple[datetime, datetime, float] | None:
+        """Return the current or next period ending after `when`."""
+        idx = bisect_right(self._ends, when)
+        return self.periods[idx] if idx < len(self.periods) else None
+
+
+class EnergiekPeriodCalendar(EnergiekSensorBase, CalendarEntity):
+    """Calendar of cheap or expensive electricity periods.
+
+    Periods are rebuilt once per coordinator update; lookups only bisect
+    the resulting index.
+    """
+
+    def __init__(
+        self,
+        coordinator: EnergiekDataUpdateCoordinator,
+        key: str,
+        name: str,
+        icon: str,
+        cutoff: CutoffFunc,
+        qualifies: Callable[[float, float], bool],
+    ) -> None:
+        """Initialize the calendar."""
+        super().__init__(coordinator)
+        self._attr_name = name
+        self._attr_icon = icon
+        self._attr_unique_id = f"{coordinator.entry.entry_id}_{key}_calendar"
+        self._summary = name
+        self._cutoff = cutoff
+        self._qualifies = qualifies
+        self._index = PeriodIndex([])
+        self._rebuild()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Rebuild the period index from new data."""
+        self._rebuild()
+        super()._handle_coordinator_update()
+
+    def _rebuild(self) -> None:
+        data: PriceData | None = (self.coordinator.data or {}).get("electricity")
+        periods = build_periods(data, self._cutoff, self._qualifies) if data else []
+        self._index = PeriodIndex(clip_to_wall_clock(data, periods))
+
+    def _event(self, period: tuple[datetime, datetime, float]) -> CalendarEvent:
+        start, end, mean = period
+        return CalendarEvent(
+            start=dt_util.as_local(start),
+            end=dt_util.as_local(end),
+            summary=self._summary,
+            description="Average price: {:.3f} EUR/kWh".format(mean),
+        )
+
+    @property
+    def event(self) -> CalendarEvent | None:
+        """Return the current or next upcoming period."""
+        period = self._index.next_after(dt_util.utcnow())
+        return self._event(period) if period else None
+
+    async def async_get_events(
+        self, hass: HomeAssistant, start_date: datetime, end_date: datetime
+    ) -> list[CalendarEvent]:
+        """Return the periods within a datetime range."""
+        return [
+            self._event(period)
+            for period in self._index.between(
+                dt_util.as_utc(start_date), dt_util.as_utc(end_date)
+            )
+        ]
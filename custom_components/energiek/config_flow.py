@@ -7,9 +7,20 @@ from typing import Any
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .const import DOMAIN
+from .const import (
+    CONF_CHEAP_PERCENTILE,
+    CONF_CHEAP_PRICE,
+    CONF_EXPENSIVE_PERCENTILE,
+    CONF_EXPENSIVE_PRICE,
+    CONF_PRICE_THRESHOLD,
+    DEFAULT_CHEAP_PERCENTILE,
+    DEFAULT_EXPENSIVE_PERCENTILE,
+    DOMAIN,
+)
 from .energiek_api import EnergiekAPI, AuthException
 
 _LOGGER = logging.getLogger(__name__)
@@ -20,6 +31,14 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> EnergiekOptionsFlow:
+        """Return the options flow handler."""
+        return EnergiekOptionsFlow()
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -30,7 +49,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             email = user_input[CONF_EMAIL]
             password = user_input[CONF_PASSWORD]
 
-            api = EnergiekAPI()
+            api = EnergiekAPI(session=async_get_clientsession(self.hass))
             try:
                 await api.login(email, password)
             except AuthException:
@@ -54,3 +73,46 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             ),
             errors=errors,
         )
+
+
+class EnergiekOptionsFlow(config_entries.OptionsFlow):
+    """Handle Energiek options."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the price threshold and calendar cutoffs."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        options = self.config_entry.options
+        percentile = vol.All(vol.Coerce(int), vol.Range(min=1, max=99))
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_PRICE_THRESHOLD,
+                        description={"suggested_value": options.get(CONF_PRICE_THRESHOLD)},
+                    ): vol.Coerce(float),
+                    vol.Required(
+                        CONF_CHEAP_PERCENTILE,
+                        default=options.get(CONF_CHEAP_PERCENTILE, DEFAULT_CHEAP_PERCENTILE),
+                    ): percentile,
+                    vol.Required(
+                        CONF_EXPENSIVE_PERCENTILE,
+                        default=options.get(
+                            CONF_EXPENSIVE_PERCENTILE, DEFAULT_EXPENSIVE_PERCENTILE
+                        ),
+                    ): percentile,
+                    vol.Optional(
+                        CONF_CHEAP_PRICE,
+                        description={"suggested_value": options.get(CONF_CHEAP_PRICE)},
+                    ): vol.Coerce(float),
+                    vol.Optional(
+                        CONF_EXPENSIVE_PRICE,
+                        description={"suggested_value": options.get(CONF_EXPENSIVE_PRICE)},
+                    ): vol.Coerce(float),
+                }
+            ),
+        )
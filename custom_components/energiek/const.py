@@ -4,6 +4,18 @@ DOMAIN = "energiek"
 
 CONF_EMAIL = "email"
 CONF_PASSWORD = "password"
+CONF_PRICE_THRESHOLD = "price_threshold"
+CONF_CHEAP_PERCENTILE = "cheap_percentile"
+CONF_EXPENSIVE_PERCENTILE = "expensive_percentile"
+CONF_CHEAP_PRICE = "cheap_price"
+CONF_EXPENSIVE_PRICE = "expensive_price"
+
+DEFAULT_CHEAP_PERCENTILE = 25
+DEFAULT_EXPENSIVE_PERCENTILE = 75
 
 DATA_COORDINATOR = "coordinator"
 DATA_API = "api"
+DATA_THRESHOLD = "threshold"
+
+EVENT_PRICE_THRESHOLD = "energiek_price_threshold"
+SIGNAL_THRESHOLD = "energiek_threshold_{}"
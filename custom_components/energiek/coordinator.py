@@ -1,8 +1,13 @@
 """Coordinator implementation for Energiek integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
+from bisect import bisect_left
+from collections.abc import Awaitable, Callable
 from datetime import datetime, timedelta
+from functools import cached_property
+from math import fsum
 from typing import TypedDict, Any
 
 from homeassistant.config_entries import ConfigEntry
@@ -16,7 +21,55 @@ from .energiek_api import EnergiekAPI, RequestException, AuthException
 LOGGER = logging.getLogger(__name__)
 
 
+QUARTER = timedelta(minutes=15)
+
+RESOLUTION_QUARTER = "quarter"
+RESOLUTION_HOUR = "hour"
+RESOLUTION_DAY = "day"
+
+
+async def _gather_all(*aws: Awaitable[Any]) -> list[Any]:
+    """Await all requests, then raise the first failure.
+
+    Unlike a plain gather, no request is still running once this raises, so
+    a late failure cannot reset the API state after a retry has started.
+    """
+    results = await asyncio.gather(*aws, return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return results
+
+
+def _hour_key(ts: datetime) -> datetime:
+    """Return the UTC hour a timestamp belongs to."""
+    return ts.replace(minute=0, second=0, microsecond=0)
+
+
+def _day_key(ts: datetime) -> datetime:
+    """Return the start of the local day a timestamp belongs to, in UTC."""
+    return dt_util.as_utc(dt_util.start_of_local_day(dt_util.as_local(ts)))
+
+
+def _next_hour(start: datetime) -> datetime:
+    """Return the start of the UTC hour after `start`."""
+    return start + timedelta(hours=1)
+
+
+def _next_day(start: datetime) -> datetime:
+    """Return the start of the local day after `start`, in UTC."""
+    return dt_util.as_utc(
+        dt_util.start_of_local_day(dt_util.as_local(start).date() + timedelta(days=1))
+    )
+
+
 class PriceData:
+    """Quarter-hour price series with derived hourly and daily views.
+
+    A new instance is created on every coordinator refresh, so the
+    aggregate views below are computed at most once per data generation.
+    """
+
     def __init__(self, prices: list[dict]):
         self.prices = prices
 
@@ -25,10 +78,94 @@ class PriceData:
         """Get the price for the current time."""
         now = dt_util.utcnow()
         for p in self.prices:
-            if p["from"] <= now < (p["from"] + timedelta(minutes=15)):
+            if p["from"] <= now < (p["from"] + QUARTER):
                 return p["price"]
         return None
 
+    @property
+    def current_hourly_price(self) -> float | None:
+        """Get the mean price of the current hour."""
+        return self._value_at(self.hourly_mean, _hour_key(dt_util.utcnow()))
+
+    @property
+    def today_average(self) -> float | None:
+        """Get the mean price of the current local day."""
+        return self._value_at(self.daily_mean, _day_key(dt_util.utcnow()))
+
+    @cached_property
+    def _hour_groups(self) -> list[tuple[datetime, list[float]]]:
+        return self._group(_hour_key, _next_hour)
+
+    @cached_property
+    def _day_groups(self) -> list[tuple[datetime, list[float]]]:
+        return self._group(_day_key, _next_day)
+
+    @cached_property
+    def hourly_mean(self) -> list[dict]:
+        """Mean price per hour."""
+        return [
+            {"from": start, "price": fsum(values) / len(values)}
+            for start, values in self._hour_groups
+        ]
+
+    @cached_property
+    def hourly_max(self) -> list[dict]:
+        """Highest quarter-hour price per hour."""
+        return [
+            {"from": start, "price": max(values)}
+            for start, values in self._hour_groups
+        ]
+
+    @cached_property
+    def daily_mean(self) -> list[dict]:
+        """Mean price per local day (23, 24 or 25 hours around DST)."""
+        return [
+            {"from": start, "price": fsum(values) / len(values)}
+            for start, values in self._day_groups
+        ]
+
+    def prices_between(
+        self, start: datetime, end: datetime, resolution: str = RESOLUTION_QUARTER
+    ) -> list[dict]:
+        """Return the entries of a view whose start lies in [start, end)."""
+        series = {
+            RESOLUTION_QUARTER: self.prices,
+            RESOLUTION_HOUR: self.hourly_mean,
+            RESOLUTION_DAY: self.daily_mean,
+        }[resolution]
+        lo = bisect_left(series, start, key=lambda p: p["from"])
+        hi = bisect_left(series, end, lo=lo, key=lambda p: p["from"])
+        return series[lo:hi]
+
+    def _group(
+        self,
+        key: Callable[[datetime], datetime],
+        following: Callable[[datetime], datetime],
+    ) -> list[tuple[datetime, list[float]]]:
+        """Split the series into hours or local days.
+
+        Only the first slot of each group is keyed; the end of the group is
+        found by bisecting the sorted series for the following boundary.
+        """
+        prices = self.prices
+        groups: list[tuple[datetime, list[float]]] = []
+        lo = 0
+        while lo < len(prices):
+            start = key(prices[lo]["from"])
+            hi = bisect_left(prices, following(start), lo=lo, key=lambda p: p["from"])
+            values = [p["price"] for p in prices[lo:hi] if p["price"] is not None]
+            if values:
+                groups.append((start, values))
+            lo = hi
+        return groups
+
+    @staticmethod
+    def _value_at(series: list[dict], start: datetime) -> float | None:
+        idx = bisect_left(series, start, key=lambda p: p["from"])
+        if idx < len(series) and series[idx]["from"] == start:
+            return series[idx]["price"]
+        return None
+
 
 class EnergiekData(TypedDict):
     electricity: PriceData | None
@@ -67,13 +204,20 @@ class EnergiekDataUpdateCoordinator(DataUpdateCoordinator):
         tomorrow_str = (now + timedelta(days=1)).strftime("%Y-%m-%d")
 
         try:
-            electricity_today = await self.api.get_market_prices(today_str, "ELECTRICITY")
-            gas_today = await self.api.get_market_prices(today_str, "GAS")
-        except RequestException as ex:
+            try:
+                (electricity_today, gas_today), tomorrow_data = await self._fetch_all(
+                    today_str, tomorrow_str
+                )
+            except AuthException:
+                # The session expired server side; log in again and retry once.
+                LOGGER.debug("Energiek session expired, logging in again")
+                await self._ensure_authenticated()
+                (electricity_today, gas_today), tomorrow_data = await self._fetch_all(
+                    today_str, tomorrow_str
+                )
+        except (AuthException, RequestException) as ex:
             raise UpdateFailed(ex) from ex
 
-        tomorrow_data = await self._fetch_tomorrow_data(tomorrow_str)
-
         electricity_prices = self._parse_prices(today_str, electricity_today)
         electricity_prices.extend(self._parse_prices(tomorrow_str, tomorrow_data["electricity"]))
 
@@ -98,12 +242,27 @@ class EnergiekDataUpdateCoordinator(DataUpdateCoordinator):
         except RequestException as ex:
             raise UpdateFailed(ex) from ex
 
+    async def _fetch_all(
+        self, today_str: str, tomorrow_str: str
+    ) -> tuple[tuple[dict | None, dict | None], dict[str, Any]]:
+        """Fetch today's and tomorrow's prices concurrently."""
+        return await _gather_all(
+            self._fetch_day(today_str),
+            self._fetch_tomorrow_data(tomorrow_str),
+        )
+
+    async def _fetch_day(self, date_str: str) -> tuple[dict | None, dict | None]:
+        """Fetch electricity and gas prices for a day concurrently."""
+        return await _gather_all(
+            self.api.get_market_prices(date_str, "ELECTRICITY"),
+            self.api.get_market_prices(date_str, "GAS"),
+        )
+
     async def _fetch_tomorrow_data(self, tomorrow_str: str) -> dict[str, Any]:
         """Fetch prices for tomorrow if available."""
         result = {"electricity": None, "gas": None, "available": False}
         try:
-            elec = await self.api.get_market_prices(tomorrow_str, "ELECTRICITY")
-            gas = await self.api.get_market_prices(tomorrow_str, "GAS")
+            elec, gas = await self._fetch_day(tomorrow_str)
 
             if elec and "withTotalVat" in elec and len(elec["withTotalVat"]["series"]) > 0:
                 result.update({"electricity": elec, "gas": gas, "available": True})
@@ -113,7 +272,7 @@ class EnergiekDataUpdateCoordinator(DataUpdateCoordinator):
 
     def _parse_prices(self, date_str: str, data: dict | None) -> list[dict]:
         """Parse the 15-minute price series."""
-        prices = []
+        prices: list[dict] = []
         if not data or "withTotalVat" not in data or "series" not in data["withTotalVat"]:
             return prices
 
@@ -130,6 +289,10 @@ class EnergiekDataUpdateCoordinator(DataUpdateCoordinator):
                 # Localize and convert to UTC
                 local_dt = naive_dt.replace(tzinfo=dt_util.get_default_time_zone())
                 utc_dt = dt_util.as_utc(local_dt)
+                # The repeated hour when DST ends has identical labels;
+                # the second occurrence is the later (fold=1) wall time.
+                if prices and utc_dt <= prices[-1]["from"]:
+                    utc_dt = dt_util.as_utc(local_dt.replace(fold=1))
 
                 prices.append({
                     "from": utc_dt,
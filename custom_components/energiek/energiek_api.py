@@ -1,14 +1,30 @@
-import asyncio
-import argparse
 import aiohttp
 from urllib.parse import unquote
-from datetime import datetime
-import json
 import logging
-import yarl
 
 _LOGGER = logging.getLogger(__name__)
 
+# Transport settings for sessions owned by EnergiekAPI.
+CONNECTION_LIMIT = 4
+KEEPALIVE_TIMEOUT = 60
+DNS_CACHE_TTL = 300
+REQUEST_TIMEOUT = 30
+
+
+def create_session(cookie_jar=None):
+    # One keep-alive pool per session: all requests go to the same host.
+    connector = aiohttp.TCPConnector(
+        limit=CONNECTION_LIMIT,
+        limit_per_host=CONNECTION_LIMIT,
+        keepalive_timeout=KEEPALIVE_TIMEOUT,
+        ttl_dns_cache=DNS_CACHE_TTL,
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        cookie_jar=cookie_jar,
+        timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT),
+    )
+
 
 class AuthException(Exception):
     pass
@@ -30,25 +46,32 @@ class EnergiekAPI:
 
     async def __aenter__(self):
         if self.session is None:
-            self.session = aiohttp.ClientSession()
-            self._close_session = True
+            self._create_session()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    def _create_session(self):
+        self.session = create_session()
+        self._close_session = True
+
+    async def close(self):
         if self._close_session and self.session is not None:
             await self.session.close()
+            self.session = None
+            self._close_session = False
 
     async def _request(self, method, endpoint, **kwargs):
         if self.session is None:
-            self.session = aiohttp.ClientSession()
-            self._close_session = True
+            self._create_session()
 
         headers = self._prepare_headers(kwargs.pop("headers", {}))
         url = f"{self.base_url}{endpoint}"
 
         try:
             async with self.session.request(method, url, headers=headers, **kwargs) as response:
-                self._update_xsrf_token(url)
+                self._update_xsrf_token(response.url)
 
                 if response.status >= 400:
                     return await self._handle_error(response, url)
@@ -77,11 +100,9 @@ class EnergiekAPI:
         return headers
 
     def _update_xsrf_token(self, url):
-        yarl_url = yarl.URL(url)
-        if 'XSRF-TOKEN' in self.session.cookie_jar.filter_cookies(yarl_url):
-            cookie = self.session.cookie_jar.filter_cookies(yarl_url).get('XSRF-TOKEN')
-            if cookie:
-                self.xsrf_token = unquote(cookie.value)
+        cookie = self.session.cookie_jar.filter_cookies(url).get('XSRF-TOKEN')
+        if cookie:
+            self.xsrf_token = unquote(cookie.value)
 
     async def _handle_error(self, response, url):
         text = await response.text()
@@ -90,10 +111,15 @@ class EnergiekAPI:
             return None
         _LOGGER.error(f"Request failed: {response.status} - {text}")
         if response.status in (401, 403):
+            # The server side session is gone; the next login starts over.
+            self.is_authenticated = False
             raise AuthException(f"Authentication failed: {response.status}")
         raise RequestException(f"Request failed: {response.status}")
 
     async def login(self, email, password):
+        self.is_authenticated = False
+        self.xsrf_token = None
+
         # 1. Get CSRF + Session
         await self._request("GET", "/api/auth/csrf")
         if not self.xsrf_token:
@@ -137,36 +163,3 @@ class EnergiekAPI:
         }
 
         return await self._request("GET", "/api/dashboard/marketprice", params=params, headers=headers)
-
-
-async def main():
-    parser = argparse.ArgumentParser(description="Energiek API CLI")
-    parser.add_argument("--email", required=True, help="Energiek email")
-    parser.add_argument("--password", required=True, help="Energiek password")
-    parser.add_argument(
-        "--date",
-        default=datetime.now().strftime("%Y-%m-%d"),
-        help="Date to fetch prices for (YYYY-MM-DD)"
-    )
-    parser.add_argument(
-        "--segment",
-        default="ELECTRICITY",
-        choices=["ELECTRICITY", "GAS"],
-        help="Market segment"
-    )
-
-    args = parser.parse_args()
-
-    async with EnergiekAPI() as api:
-        try:
-            await api.login(args.email, args.password)
-            print("Login successful!")
-
-            print(f"Fetching {args.segment} prices for {args.date}...")
-            prices = await api.get_market_prices(args.date, args.segment)
-            print(json.dumps(prices, indent=2))
-        except Exception as e:
-            print(f"Error: {e}")
-
-if __name__ == "__main__":
-    asyncio.run(main())
@@ -22,6 +22,8 @@ async def async_setup_entry(
     entities = [
         EnergiekElectricityPriceSensor(coordinator),
         EnergiekGasPriceSensor(coordinator),
+        EnergiekElectricityHourlyPriceSensor(coordinator),
+        EnergiekElectricityDailyAverageSensor(coordinator),
     ]
 
     async_add_entities(entities)
@@ -111,3 +113,70 @@ class EnergiekGasPriceSensor(EnergiekSensorBase, SensorEntity):
                 for p in prices
             ]
         return attrs
+
+
+class EnergiekElectricityHourlyPriceSensor(EnergiekSensorBase, SensorEntity):
+    """Sensor for the mean electricity price of the current hour."""
+
+    _attr_name = "Current Hourly Electricity Price (All-in)"
+    _attr_native_unit_of_measurement = "EUR/kWh"
+    _attr_device_class = SensorDeviceClass.MONETARY
+    _attr_state_class = None
+    _attr_icon = "mdi:lightning-bolt"
+
+    def __init__(self, coordinator: EnergiekDataUpdateCoordinator) -> None:
+        """Initialize the hourly electricity sensor."""
+        super().__init__(coordinator)
+        self._attr_unique_id = f"{coordinator.entry.entry_id}_electricity_hourly_price"
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the mean price of the current hour."""
+        if self.coordinator.data.get("electricity"):
+            return self.coordinator.data["electricity"].current_hourly_price
+        return None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, any]:
+        """Return extra state attributes."""
+        attrs = {}
+        if self.coordinator.data.get("electricity"):
+            data = self.coordinator.data["electricity"]
+            attrs["prices"] = [
+                {"from": mean["from"].isoformat(), "price": mean["price"], "max": peak["price"]}
+                for mean, peak in zip(data.hourly_mean, data.hourly_max)
+            ]
+        return attrs
+
+
+class EnergiekElectricityDailyAverageSensor(EnergiekSensorBase, SensorEntity):
+    """Sensor for the mean electricity price of the current day."""
+
+    _attr_name = "Average Electricity Price Today (All-in)"
+    _attr_native_unit_of_measurement = "EUR/kWh"
+    _attr_device_class = SensorDeviceClass.MONETARY
+    _attr_state_class = None
+    _attr_icon = "mdi:lightning-bolt-outline"
+
+    def __init__(self, coordinator: EnergiekDataUpdateCoordinator) -> None:
+        """Initialize the daily average sensor."""
+        super().__init__(coordinator)
+        self._attr_unique_id = f"{coordinator.entry.entry_id}_electricity_daily_average"
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the mean price of today."""
+        if self.coordinator.data.get("electricity"):
+            return self.coordinator.data["electricity"].today_average
+        return None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, any]:
+        """Return extra state attributes."""
+        attrs = {}
+        if self.coordinator.data.get("electricity"):
+            attrs["prices"] = [
+                {"from": p["from"].isoformat(), "price": p["price"]}
+                for p in self.coordinator.data["electricity"].daily_mean
+            ]
+        return attrs
@@ -0,0 +1,114 @@
+"""Timer-driven price threshold crossings for the Energiek integration."""
+from __future__ import annotations
+
+import logging
+from datetime import datetime
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_track_point_in_utc_time
+import homeassistant.util.dt as dt_util
+
+from .const import CONF_PRICE_THRESHOLD, EVENT_PRICE_THRESHOLD, SIGNAL_THRESHOLD
+from .coordinator import EnergiekDataUpdateCoordinator, PriceData
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def find_crossings(
+    data: PriceData, threshold: float, after: datetime
+) -> list[tuple[datetime, bool, float]]:
+    """Return the slots after `after` where the below-threshold state flips."""
+    crossings: list[tuple[datetime, bool, float]] = []
+    previous: bool | None = None
+    for p in data.prices:
+        if p["price"] is None:
+            continue
+        below = p["price"] < threshold
+        if previous is not None and below != previous and p["from"] > after:
+            crossings.append((p["from"], below, p["price"]))
+        previous = below
+    return crossings
+
+
+class PriceThresholdScheduler:
+    """Schedule exact timers for the moments the electricity price crosses a threshold.
+
+    The schedule is rebuilt after every coordinator refresh. Timers that are
+    still valid are kept, stale ones are cancelled and only new crossings get
+    a fresh timer.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        coordinator: EnergiekDataUpdateCoordinator,
+    ) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self.entry = entry
+        self.coordinator = coordinator
+        self.threshold: float = entry.options[CONF_PRICE_THRESHOLD]
+        self.is_below: bool | None = None
+        self._scheduled: dict[tuple[datetime, bool, float], CALLBACK_TYPE] = {}
+
+    @property
+    def signal(self) -> str:
+        """Dispatcher signal sent when the below-threshold state changes."""
+        return SIGNAL_THRESHOLD.format(self.entry.entry_id)
+
+    @callback
+    def async_update(self) -> None:
+        """Rebuild the schedule from the latest coordinator data."""
+        data: PriceData | None = (self.coordinator.data or {}).get("electricity")
+        if data is None:
+            return
+
+        price = data.current_price
+        self.is_below = None if price is None else price < self.threshold
+
+        now = dt_util.utcnow()
+        wanted = set(find_crossings(data, self.threshold, now))
+        for key in set(self._scheduled) - wanted:
+            # Timers that are already due must still fire, or the event is lost.
+            if key[0] > now:
+                self._scheduled.pop(key)()
+        for key in sorted(wanted - set(self._scheduled)):
+            self._scheduled[key] = async_track_point_in_utc_time(
+                self.hass, self._make_action(key), key[0]
+            )
+
+        _LOGGER.debug("Scheduled %s price threshold crossings", len(self._scheduled))
+
+    @callback
+    def async_cancel(self) -> None:
+        """Cancel all pending timers."""
+        for unsub in self._scheduled.values():
+            unsub()
+        self._scheduled.clear()
+
+    def _make_action(self, key: tuple[datetime, bool, float]):
+        @callback
+        def _fire(now: datetime) -> None:
+            self._scheduled.pop(key, None)
+            self._async_cross(*key)
+
+        return _fire
+
+    @callback
+    def _async_cross(self, start: datetime, below: bool, price: float) -> None:
+        self.is_below = below
+        self.hass.bus.async_fire(
+            EVENT_PRICE_THRESHOLD,
+            {
+                "entry_id": self.entry.entry_id,
+                "segment": "electricity",
+                "direction": "below" if below else "above",
+                "threshold": self.threshold,
+                "price": price,
+                "from": start.isoformat(),
+            },
+        )
+        async_dispatcher_send(self.hass, self.signal)
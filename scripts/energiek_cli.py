@@ -0,0 +1,54 @@
+"""Command line client for the Energiek API.
+
+Fetches market prices without Home Assistant. Lives outside the
+integration package so Home Assistant never imports it.
+"""
+import asyncio
+import argparse
+import importlib.util
+import json
+import os
+from datetime import datetime
+
+# Load the client module by path: putting the package directory on sys.path
+# would let the integration's calendar.py shadow the standard library.
+_spec = importlib.util.spec_from_file_location(
+    "energiek_api",
+    os.path.join(os.path.dirname(__file__), "..", "custom_components", "energiek", "energiek_api.py"),
+)
+energiek_api = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(energiek_api)
+EnergiekAPI = energiek_api.EnergiekAPI
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Energiek API CLI")
+    parser.add_argument("--email", required=True, help="Energiek email")
+    parser.add_argument("--password", required=True, help="Energiek password")
+    parser.add_argument(
+        "--date",
+        default=datetime.now().strftime("%Y-%m-%d"),
+        help="Date to fetch prices for (YYYY-MM-DD)"
+    )
+    parser.add_argument(
+        "--segment",
+        default="ELECTRICITY",
+        choices=["ELECTRICITY", "GAS"],
+        help="Market segment"
+    )
+
+    args = parser.parse_args()
+
+    async with EnergiekAPI() as api:
+        try:
+            await api.login(args.email, args.password)
+            print("Login successful!")
+
+            print(f"Fetching {args.segment} prices for {args.date}...")
+            prices = await api.get_market_prices(args.date, args.segment)
+            print(json.dumps(prices, indent=2))
+        except Exception as e:
+            print(f"Error: {e}")
+
+if __name__ == "__main__":
+    asyncio.run(main())
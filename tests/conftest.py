@@ -1,10 +1,17 @@
 import sys
 import pytest
+import pytest_asyncio
+from unittest.mock import AsyncMock, patch
 from os.path import abspath, dirname
 
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
 root_dir = abspath(dirname(__file__) + "/../custom_components/")
 sys.path.append(root_dir)
 
+from custom_components.energiek import const  # noqa: E402
+
 
 def _rename_pycares_shutdown_thread():
     """Ensure pycares background thread name matches allowed pattern."""
@@ -25,3 +32,39 @@ def rename_pycares_thread():
     _rename_pycares_shutdown_thread()
     yield
     _rename_pycares_shutdown_thread()
+
+
+@pytest.fixture
+def mock_energiek_api():
+    with patch(
+        "custom_components.energiek.EnergiekAPI", autospec=True
+    ) as mock_api_class:
+        mock_api = mock_api_class.return_value
+        mock_api.is_authenticated = True
+        mock_api.login = AsyncMock()
+        mock_api.get_market_prices = AsyncMock()
+        yield mock_api
+
+
+@pytest_asyncio.fixture
+async def amsterdam(hass: HomeAssistant):
+    """Run the test in the Europe/Amsterdam time zone."""
+    await hass.config.async_set_time_zone("Europe/Amsterdam")
+
+
+@pytest.fixture
+def entry_options():
+    """Options for energiek_config_entry; override per module or parametrize."""
+    return {}
+
+
+@pytest_asyncio.fixture
+async def energiek_config_entry(hass: HomeAssistant, entry_options):
+    config_entry = MockConfigEntry(
+        domain=const.DOMAIN,
+        data={const.CONF_EMAIL: "test@mail.com", const.CONF_PASSWORD: "pw"},
+        options=entry_options,
+        unique_id="test@mail.com",
+    )
+    config_entry.add_to_hass(hass)
+    return config_entry
@@ -0,0 +1,157 @@
+from datetime import datetime, timedelta
+import logging
+from unittest.mock import AsyncMock, MagicMock
+import operator
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.energiek import const
+from custom_components.energiek.calendar import (
+    EnergiekPeriodCalendar,
+    PeriodIndex,
+    _cutoff,
+    build_periods,
+)
+from custom_components.energiek.coordinator import PriceData
+
+from .utils import generate_prices_response
+
+pytestmark = pytest.mark.usefixtures("enable_custom_integrations")
+
+
+def price_data(start: datetime, values: list[float]) -> PriceData:
+    start = dt.as_utc(start)
+    return PriceData(
+        [
+            {"from": start + timedelta(minutes=15 * i), "price": value}
+            for i, value in enumerate(values)
+        ]
+    )
+
+
+async def test_merges_consecutive_slots(amsterdam):
+    start = datetime(2023, 1, 1, tzinfo=dt.get_default_time_zone())
+    data = price_data(start, [round(0.2 + (i % 10) * 0.01, 3) for i in range(96)])
+
+    periods = build_periods(data, _cutoff(0.22, 25), operator.le)
+
+    assert len(periods) == 10
+    assert all(end - begin == timedelta(minutes=45) for begin, end, _ in periods)
+    assert periods[0][0] == dt.as_utc(start)
+    assert periods[0][2] == pytest.approx(0.21)
+
+
+async def test_percentile_cutoff(amsterdam):
+    start = datetime(2023, 1, 1, tzinfo=dt.get_default_time_zone())
+    data = price_data(start, [i / 100 for i in range(96)])
+
+    cheap = build_periods(data, _cutoff(None, 25), operator.le)
+    expensive = build_periods(data, _cutoff(None, 75), operator.ge)
+
+    assert cheap == [(dt.as_utc(start), dt.as_utc(start) + timedelta(hours=6), pytest.approx(0.115))]
+    assert expensive[0][0] == dt.as_utc(start) + timedelta(hours=18)
+    assert expensive[0][1] == dt.as_utc(start) + timedelta(hours=24)
+
+
+async def test_range_query_spanning_midnight(amsterdam):
+    start = datetime(2023, 1, 1, tzinfo=dt.get_default_time_zone())
+    values = [0.3] * 92 + [0.1] * 4 + [0.1] * 2 + [0.3] * 94
+    index = PeriodIndex(build_periods(price_data(start, values), _cutoff(0.2, 25), operator.le))
+
+    assert len(index.periods) == 1
+    begin, end, _ = index.periods[0]
+    assert begin == dt.as_utc(start + timedelta(hours=23))
+    assert end == dt.as_utc(start + timedelta(days=1, minutes=30))
+
+    midnight = dt.as_utc(start + timedelta(days=1))
+    assert index.between(midnight - timedelta(minutes=1), midnight + timedelta(minutes=1)) == index.periods
+    assert index.between(midnight + timedelta(minutes=30), midnight + timedelta(hours=2)) == []
+    assert index.between(midnight - timedelta(hours=3), begin) == []
+    assert index.next_after(midnight) == index.periods[0]
+    assert index.next_after(end) is None
+
+
+@pytest.mark.parametrize(("day", "hours"), [(datetime(2023, 3, 26), 23), (datetime(2023, 10, 29), 25)])
+async def test_dst_days(amsterdam, day, hours):
+    start = day.replace(tzinfo=dt.get_default_time_zone())
+    following = start + timedelta(days=1)
+    data = price_data(start, [0.1] * (hours * 4) + [0.3] * 96)
+
+    periods = build_periods(data, _cutoff(0.2, 25), operator.le)
+
+    assert periods == [(dt.as_utc(start), dt.as_utc(following), pytest.approx(0.1))]
+    assert periods[0][1] - periods[0][0] == timedelta(hours=hours)
+
+
+async def test_period_within_repeated_hour(amsterdam, freezer, caplog):
+    tz = dt.get_default_time_zone()
+    start = datetime(2023, 10, 29, tzinfo=tz)
+    # 02:30+02:00 to 02:15+01:00 is cheap, as is 08:00 to 09:00.
+    values = [0.3] * 100
+    values[10:13] = [0.1, 0.1, 0.05]
+    values[36:40] = [0.1] * 4
+    coordinator = MagicMock(data={"electricity": price_data(start, values)})
+    freezer.move_to(dt.as_utc(start) + timedelta(hours=2))
+    caplog.set_level(logging.DEBUG, logger="custom_components.energiek.calendar")
+
+    calendar = EnergiekPeriodCalendar(
+        coordinator, "cheap", "Cheap Electricity", "mdi:cash-minus", _cutoff(0.2, 25), operator.le
+    )
+
+    # Only the part from the second 02:00 on can be shown on the wall clock.
+    assert dt.as_utc(calendar.event.start) == datetime(2023, 10, 29, 1, 0, tzinfo=dt.UTC)
+    assert dt.as_utc(calendar.event.end) == datetime(2023, 10, 29, 1, 15, tzinfo=dt.UTC)
+    assert calendar.event.description == "Average price: 0.050 EUR/kWh"
+    assert "Clipping period" in caplog.text
+    events = await calendar.async_get_events(None, start, start + timedelta(days=1))
+    assert [dt.as_utc(e.end) - dt.as_utc(e.start) for e in events] == [
+        timedelta(minutes=15),
+        timedelta(hours=1),
+    ]
+
+
+@pytest.mark.parametrize("entry_options", [{const.CONF_CHEAP_PRICE: 0.22}])
+async def test_calendar_events(
+    mock_energiek_api: AsyncMock,
+    energiek_config_entry: MockConfigEntry,
+    hass: HomeAssistant,
+    amsterdam,
+    freezer,
+):
+    tz = dt.get_default_time_zone()
+    freezer.move_to(datetime(2023, 1, 1, 12, 0, tzinfo=tz))
+
+    async def mock_get_prices(date_str, segment):
+        base = 0.2 if segment == "ELECTRICITY" else 1.2
+        return generate_prices_response(base)
+
+    mock_energiek_api.get_market_prices.side_effect = mock_get_prices
+
+    await hass.config_entries.async_setup(energiek_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    # 12:00 (slot 48) is expensive, the next cheap run starts at 12:30.
+    state = hass.states.get("calendar.cheap_electricity")
+    assert state.state == "off"
+    assert state.attributes["start_time"] == "2023-01-01 12:30:00"
+    assert hass.states.get("calendar.expensive_electricity").state == "on"
+
+    response = await hass.services.async_call(
+        "calendar",
+        "get_events",
+        {
+            "start_date_time": datetime(2023, 1, 1, 22, 0, tzinfo=tz),
+            "end_date_time": datetime(2023, 1, 2, 2, 0, tzinfo=tz),
+        },
+        target={"entity_id": "calendar.cheap_electricity"},
+        blocking=True,
+        return_response=True,
+    )
+    events = response["calendar.cheap_electricity"]["events"]
+    assert [(e["start"], e["end"]) for e in events] == [
+        ("2023-01-01T22:30:00+01:00", "2023-01-01T23:15:00+01:00"),
+        ("2023-01-02T00:00:00+01:00", "2023-01-02T00:45:00+01:00"),
+    ]
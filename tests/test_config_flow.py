@@ -0,0 +1,29 @@
+from unittest.mock import patch
+
+import pytest
+from homeassistant import config_entries
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from custom_components.energiek import const
+
+pytestmark = pytest.mark.usefixtures("enable_custom_integrations")
+
+
+async def test_user_flow_uses_shared_session(hass: HomeAssistant):
+    with patch(
+        "custom_components.energiek.config_flow.EnergiekAPI", autospec=True
+    ) as mock_api_class, patch(
+        "custom_components.energiek.async_setup_entry", return_value=True
+    ):
+        result = await hass.config_entries.flow.async_init(
+            const.DOMAIN, context={"source": config_entries.SOURCE_USER}
+        )
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"],
+            {const.CONF_EMAIL: "test@mail.com", const.CONF_PASSWORD: "pw"},
+        )
+
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    mock_api_class.assert_called_once_with(session=async_get_clientsession(hass))
@@ -0,0 +1,130 @@
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.energiek.coordinator import EnergiekDataUpdateCoordinator
+from custom_components.energiek.energiek_api import AuthException, EnergiekAPI
+
+from .utils import FakeClock, FakeEnergiekServer, generate_prices_response, local_session
+
+pytestmark = pytest.mark.usefixtures("enable_custom_integrations", "amsterdam")
+
+
+class ExpiringSessionAPI:
+    """Fake API whose session has expired until the next login.
+
+    Gas requests answer later than electricity requests, so a failed
+    refresh can leave a slow 401 behind.
+    """
+
+    def __init__(self):
+        self.is_authenticated = True
+        self.expired = True
+        self.logins = 0
+        self.in_flight = 0
+
+    async def login(self, email, password):
+        self.logins += 1
+        self.expired = False
+        self.is_authenticated = True
+
+    async def get_market_prices(self, date_str, market_segment="ELECTRICITY"):
+        if not self.is_authenticated:
+            raise AuthException("Not authenticated. Please login first.")
+        expired = self.expired
+        self.in_flight += 1
+        try:
+            await asyncio.sleep(0.05 if market_segment == "GAS" else 0)
+        finally:
+            self.in_flight -= 1
+        if expired:
+            self.is_authenticated = False
+            raise AuthException("Authentication failed: 401")
+        return generate_prices_response(0.2)
+
+
+async def test_failed_fetch_leaves_no_request_running(
+    energiek_config_entry: MockConfigEntry,
+    hass: HomeAssistant,
+):
+    api = ExpiringSessionAPI()
+    coordinator = EnergiekDataUpdateCoordinator(hass, energiek_config_entry, api)
+
+    with pytest.raises(AuthException):
+        await coordinator._fetch_all("2023-01-01", "2023-01-02")
+    assert api.in_flight == 0
+
+
+async def test_late_401_does_not_undo_relogin(
+    energiek_config_entry: MockConfigEntry,
+    hass: HomeAssistant,
+):
+    api = ExpiringSessionAPI()
+    coordinator = EnergiekDataUpdateCoordinator(hass, energiek_config_entry, api)
+
+    await coordinator.async_refresh()
+    assert coordinator.last_update_success
+    assert api.is_authenticated
+    assert api.logins == 1
+
+    await coordinator.async_refresh()
+    assert coordinator.last_update_success
+    assert api.logins == 1
+
+
+@pytest.mark.usefixtures("socket_enabled")
+async def test_expired_session_relogs_in_and_retries(
+    energiek_config_entry: MockConfigEntry,
+    hass: HomeAssistant,
+):
+    clock = FakeClock(datetime(2023, 1, 1, 14, 0, tzinfo=dt.get_default_time_zone()))
+    server = FakeEnergiekServer(clock, outages=[], publish_delays={})
+    await server.server.start_server(access_log=None)
+    session = local_session()
+    api = EnergiekAPI(session=session)
+    api.base_url = server.base_url
+    coordinator = EnergiekDataUpdateCoordinator(hass, energiek_config_entry, api)
+
+    try:
+        with patch.object(dt, "utcnow", clock.utcnow), patch.object(dt, "now", clock.now):
+            await api.login("test@mail.com", "pw")
+            server.sessions.clear()
+
+            # The 401 marks the API unauthenticated; the refresh logs in and retries.
+            await coordinator.async_refresh()
+            assert coordinator.last_update_success
+            assert coordinator.data["tomorrow_available"]
+            assert api.is_authenticated
+            assert server.logins == 2
+
+            server.sessions.clear()
+            with pytest.raises(AuthException):
+                await api.get_market_prices("2023-01-01")
+            assert not api.is_authenticated
+    finally:
+        await session.close()
+        await server.server.close()
+
+
+async def test_parse_fall_back_day(
+    energiek_config_entry: MockConfigEntry,
+    hass: HomeAssistant,
+):
+    coordinator = EnergiekDataUpdateCoordinator(hass, energiek_config_entry, ExpiringSessionAPI())
+    # 02:00 to 02:45 appear twice when the clocks go back.
+    hours = list(range(3)) + [2] + list(range(3, 24))
+    labels = [{"label": "{:02d}:{:02d}".format(h, m)} for h in hours for m in (0, 15, 30, 45)]
+    data = {"withTotalVat": {"series": [0.2] * len(labels), "labels": labels}}
+
+    prices = coordinator._parse_prices("2023-10-29", data)
+
+    starts = [p["from"] for p in prices]
+    assert len(starts) == 100
+    assert all(later - earlier == timedelta(minutes=15) for earlier, later in zip(starts, starts[1:]))
+    assert starts[0] == datetime(2023, 10, 28, 22, 0, tzinfo=dt.UTC)
+    assert starts[-1] == datetime(2023, 10, 29, 22, 45, tzinfo=dt.UTC)
@@ -0,0 +1,174 @@
+import asyncio
+import gc
+import gzip
+import json
+import warnings
+from unittest.mock import patch
+
+import aiohttp
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from custom_components.energiek import energiek_api
+from custom_components.energiek.energiek_api import (
+    CONNECTION_LIMIT,
+    DNS_CACHE_TTL,
+    REQUEST_TIMEOUT,
+    EnergiekAPI,
+)
+
+from .utils import generate_prices_response
+
+pytestmark = pytest.mark.usefixtures("socket_enabled")
+
+RAW_BODY = json.dumps(generate_prices_response(0.2)).encode()
+
+
+class ServerStats:
+    def __init__(self):
+        self.connections = set()
+        self.requests = 0
+        self.bytes_sent = 0
+        self.accept_encoding = None
+        self.delay = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+
+@pytest_asyncio.fixture
+async def price_server():
+    stats = ServerStats()
+
+    async def marketprice(request: web.Request) -> web.Response:
+        stats.requests += 1
+        stats.connections.add(request.transport.get_extra_info("peername"))
+        stats.accept_encoding = request.headers.get("Accept-Encoding", "")
+        stats.in_flight += 1
+        stats.max_in_flight = max(stats.max_in_flight, stats.in_flight)
+        try:
+            await asyncio.sleep(stats.delay)
+        finally:
+            stats.in_flight -= 1
+        body, headers = RAW_BODY, {}
+        if "gzip" in stats.accept_encoding:
+            body, headers = gzip.compress(RAW_BODY), {"Content-Encoding": "gzip"}
+        stats.bytes_sent += len(body)
+        return web.Response(body=body, headers=headers, content_type="application/json")
+
+    app = web.Application()
+    app.router.add_get("/api/dashboard/marketprice", marketprice)
+    server = TestServer(app, host="127.0.0.1")
+    await server.start_server()
+    yield server, stats
+    await server.close()
+
+
+def authenticated_api(server: TestServer) -> EnergiekAPI:
+    api = EnergiekAPI()
+    api.base_url = str(server.make_url("")).rstrip("/")
+    api.is_authenticated = True
+    api.org_uuid = "org"
+    api.cluster = "cluster"
+    return api
+
+
+async def test_tuned_connector(price_server):
+    server, _ = price_server
+
+    with patch.object(aiohttp, "TCPConnector", wraps=aiohttp.TCPConnector) as connector_cls:
+        async with authenticated_api(server) as api:
+            await api.get_market_prices("2023-01-01")
+            connector = api.session.connector
+
+            assert connector.limit == CONNECTION_LIMIT
+            assert connector.limit_per_host == CONNECTION_LIMIT
+            assert connector.use_dns_cache
+            assert api.session.timeout.total == REQUEST_TIMEOUT
+
+    # The DNS cache lifetime is not exposed, so check what the connector got.
+    assert connector_cls.call_args.kwargs["ttl_dns_cache"] == DNS_CACHE_TTL
+
+
+async def test_keepalive_timeout(price_server):
+    server, stats = price_server
+
+    # A short timeout keeps the test fast; the factory must still honour it.
+    with patch.object(energiek_api, "KEEPALIVE_TIMEOUT", 0.5):
+        async with authenticated_api(server) as api:
+            await api.get_market_prices("2023-01-01")
+            await asyncio.sleep(0.1)
+            await api.get_market_prices("2023-01-01")
+            assert len(stats.connections) == 1
+
+            await asyncio.sleep(1)
+            await api.get_market_prices("2023-01-01")
+
+    assert len(stats.connections) == 2
+
+
+async def test_connection_pool_is_bounded(price_server):
+    server, stats = price_server
+    stats.delay = 0.05
+
+    async with authenticated_api(server) as api:
+        await asyncio.gather(
+            *(api.get_market_prices("2023-01-01") for _ in range(3 * CONNECTION_LIMIT))
+        )
+
+    assert stats.requests == 3 * CONNECTION_LIMIT
+    assert stats.max_in_flight == CONNECTION_LIMIT
+    # Later requests wait for a pooled connection instead of opening new ones.
+    assert len(stats.connections) == CONNECTION_LIMIT
+
+
+async def test_connection_reuse(price_server):
+    server, stats = price_server
+
+    async with authenticated_api(server) as api:
+        for _ in range(10):
+            await api.get_market_prices("2023-01-01")
+
+    assert stats.requests == 10
+    assert len(stats.connections) == 1
+
+
+async def test_compressed_responses(price_server):
+    server, stats = price_server
+
+    async with authenticated_api(server) as api:
+        prices = await api.get_market_prices("2023-01-01")
+
+    assert prices == json.loads(RAW_BODY)
+    assert "gzip" in stats.accept_encoding
+    assert stats.bytes_sent < len(RAW_BODY) / 3
+
+
+async def test_owned_session_is_closed(price_server):
+    server, _ = price_server
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+
+        api = authenticated_api(server)
+        await api.get_market_prices("2023-01-01")
+        session = api.session
+        await api.close()
+        assert session.closed
+        assert api.session is None
+
+        del api, session
+        gc.collect()
+
+    assert not [w for w in caught if "Unclosed" in str(w.message)]
+
+
+async def test_external_session_is_not_closed(price_server):
+    server, _ = price_server
+
+    async with authenticated_api(server) as owner:
+        async with EnergiekAPI(session=owner.session) as api:
+            api.base_url = owner.base_url
+            api.is_authenticated = True
+        assert not owner.session.closed
@@ -0,0 +1,76 @@
+from datetime import datetime, timedelta
+
+import pytest
+from homeassistant.util import dt
+
+from custom_components.energiek.coordinator import (
+    RESOLUTION_DAY,
+    RESOLUTION_HOUR,
+    PriceData,
+)
+
+
+def generate_day(date: datetime, slots: int) -> list[dict]:
+    start = dt.as_utc(date)
+    return [
+        {"from": start + timedelta(minutes=15 * i), "price": round(0.2 + (i % 4) * 0.01, 3)}
+        for i in range(slots)
+    ]
+
+
+@pytest.mark.parametrize(
+    ("day", "hours"),
+    [
+        (datetime(2023, 1, 1), 24),
+        (datetime(2023, 3, 26), 23),
+        (datetime(2023, 10, 29), 25),
+    ],
+)
+async def test_aggregates_follow_local_day_length(amsterdam, day, hours):
+    local_day = day.replace(tzinfo=dt.get_default_time_zone())
+    data = PriceData(generate_day(local_day, hours * 4))
+
+    assert len(data.hourly_mean) == hours
+    assert len(data.hourly_max) == hours
+    assert [p["price"] for p in data.hourly_max] == [0.23] * hours
+    assert data.hourly_mean[0]["price"] == pytest.approx(0.215)
+    assert data.hourly_mean[-1]["from"] - data.hourly_mean[0]["from"] == timedelta(hours=hours - 1)
+
+    assert len(data.daily_mean) == 1
+    assert data.daily_mean[0]["from"] == dt.as_utc(local_day)
+    assert data.daily_mean[0]["price"] == pytest.approx(0.215)
+
+
+async def test_aggregates_are_cached(amsterdam):
+    local_day = datetime(2023, 1, 1, tzinfo=dt.get_default_time_zone())
+    data = PriceData(generate_day(local_day, 96 * 2))
+
+    assert data.hourly_mean is data.hourly_mean
+    assert data.daily_mean is data.daily_mean
+    assert len(data.daily_mean) == 2
+
+
+async def test_prices_between(amsterdam):
+    local_day = datetime(2023, 10, 29, tzinfo=dt.get_default_time_zone())
+    data = PriceData(generate_day(local_day, 100) + generate_day(local_day + timedelta(days=1), 96))
+    start = dt.as_utc(local_day)
+
+    assert len(data.prices_between(start, start + timedelta(hours=2))) == 8
+    hourly = data.prices_between(start, start + timedelta(hours=25), RESOLUTION_HOUR)
+    assert len(hourly) == 25
+    daily = data.prices_between(start, start + timedelta(days=3), RESOLUTION_DAY)
+    assert [p["from"] for p in daily] == [start, start + timedelta(hours=25)]
+
+
+async def test_missing_prices_are_skipped(amsterdam):
+    local_day = datetime(2023, 1, 1, tzinfo=dt.get_default_time_zone())
+    prices = generate_day(local_day, 96)
+    for p in prices[:4] + prices[5:6]:
+        p["price"] = None
+    data = PriceData(prices)
+
+    # The first hour has no prices left, the second one is missing a slot.
+    assert len(data.hourly_mean) == 23
+    assert data.hourly_mean[0]["from"] == dt.as_utc(local_day) + timedelta(hours=1)
+    assert data.hourly_mean[0]["price"] == pytest.approx((0.2 + 0.22 + 0.23) / 3)
+    assert data.daily_mean[0]["from"] == dt.as_utc(local_day)
@@ -2,7 +2,6 @@ from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, patch
 
 import pytest
-import pytest_asyncio
 from homeassistant import config_entries
 from homeassistant.core import HomeAssistant
 from homeassistant.util import dt
@@ -11,48 +10,11 @@ from pytest_homeassistant_custom_component.common import (
     async_fire_time_changed,
 )
 
-from custom_components.energiek import const
+from .utils import generate_prices_response
 
 pytestmark = pytest.mark.usefixtures("enable_custom_integrations")
 
 
-@pytest.fixture
-def mock_energiek_api():
-    with patch(
-        "custom_components.energiek.EnergiekAPI", autospec=True
-    ) as mock_api_class:
-        mock_api = mock_api_class.return_value
-        mock_api.is_authenticated = True
-        mock_api.login = AsyncMock()
-        mock_api.get_market_prices = AsyncMock()
-        yield mock_api
-
-
-@pytest_asyncio.fixture
-async def energiek_config_entry(hass: HomeAssistant):
-    config_entry = MockConfigEntry(
-        domain=const.DOMAIN,
-        data={const.CONF_EMAIL: "test@mail.com", const.CONF_PASSWORD: "pw"},
-        unique_id="test@mail.com",
-    )
-    config_entry.add_to_hass(hass)
-    return config_entry
-
-
-def generate_prices_response(base_price):
-    return {
-        "withTotalVat": {
-            "series": [round(base_price + (i % 10) * 0.01, 3) for i in range(96)],
-            "labels": [
-                {
-                    "label": "{:02d}:{:02d}".format(i // 4, (i % 4) * 15)
-                }
-                for i in range(96)
-            ],
-        }
-    }
-
-
 async def trigger_update(hass, delta_seconds=config_entries.RELOAD_AFTER_UPDATE_DELAY):
     """Trigger a reload of the data."""
     async_fire_time_changed(
@@ -102,6 +64,15 @@ async def test_sensors(
     elec_attrs = hass.states.get("sensor.current_electricity_price_all_in").attributes
     assert len(elec_attrs["prices"]) == 192  # Today + Tomorrow
 
+    hourly = hass.states.get("sensor.current_hourly_electricity_price_all_in")
+    assert float(hourly.state) == pytest.approx(0.245)
+    assert len(hourly.attributes["prices"]) == 48
+    assert hourly.attributes["prices"][12]["max"] == 0.29
+
+    daily = hass.states.get("sensor.average_electricity_price_today_all_in")
+    assert float(daily.state) == pytest.approx(0.24375)
+    assert len(daily.attributes["prices"]) == 2
+
 
 @patch("custom_components.energiek.coordinator.dt_util.now")
 @patch("custom_components.energiek.coordinator.dt_util.utcnow")
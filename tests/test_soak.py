@@ -0,0 +1,178 @@
+"""Soak test driving the integration through weeks of simulated operation.
+
+A fake clock replaces ``dt_util.now``/``utcnow`` and a local aiohttp server
+plays the Energiek backend, including DST days, late publication of
+tomorrow's prices, expiring sessions, rotating XSRF tokens and outages.
+The entry is created through the config flow and set up like in production,
+and a daily CLI-style client exercises the session EnergiekAPI owns. Both
+use the integration's own session factory, only with a cookie jar that
+accepts the local server's IP address. Memory, open connections, request
+counts and refresh latency are sampled per simulated day and checked for
+growth trends.
+"""
+import gc
+import statistics
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+from homeassistant import config_entries
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType
+from homeassistant.util import dt
+
+from custom_components.energiek import const, energiek_api
+from custom_components.energiek.energiek_api import CONNECTION_LIMIT, EnergiekAPI
+
+from .utils import (
+    SESSION_TTL,
+    FakeClock,
+    FakeEnergiekServer,
+    day_slots,
+    energiek_at,
+    local_session,
+)
+
+pytestmark = [
+    pytest.mark.soak,
+    pytest.mark.usefixtures("enable_custom_integrations", "amsterdam", "socket_enabled"),
+]
+
+SOAK_DAYS = 14
+WARMUP_DAYS = 2
+REFRESH_INTERVAL = timedelta(minutes=30)
+
+# Growth allowed per simulated day once warmed up.
+MAX_MEMORY_SLOPE = 64 * 1024
+MAX_REQUEST_SLOPE = 4
+
+
+def tracked_memory() -> int:
+    gc.collect()
+    snapshot = tracemalloc.take_snapshot().filter_traces(
+        [
+            tracemalloc.Filter(True, "*custom_components/energiek/*"),
+            tracemalloc.Filter(True, "*aiohttp/*"),
+        ]
+    )
+    return sum(stat.size for stat in snapshot.statistics("filename"))
+
+
+def slope(samples: list[float]) -> float:
+    return statistics.linear_regression(range(len(samples)), samples).slope
+
+
+@pytest.mark.parametrize(
+    "start",
+    [
+        datetime(2023, 3, 20, 0, 5),  # spans the switch to summer time
+        datetime(2023, 10, 23, 0, 5),  # spans the switch to winter time
+    ],
+    ids=["spring", "autumn"],
+)
+async def test_soak(hass: HomeAssistant, start: datetime):
+    start = start.replace(tzinfo=dt.get_default_time_zone())
+    clock = FakeClock(start)
+
+    outages = [
+        (dt.as_utc(start + timedelta(days=4, hours=10)), dt.as_utc(start + timedelta(days=4, hours=12))),
+        (dt.as_utc(start + timedelta(days=9, hours=23, minutes=30)), dt.as_utc(start + timedelta(days=10, hours=1))),
+    ]
+    publish_delays = {(start + timedelta(days=3)).date(): timedelta(hours=3)}
+    server = FakeEnergiekServer(clock, outages, publish_delays)
+    await server.server.start_server(access_log=None)
+
+    # Stands in for Home Assistant's shared client session.
+    shared = local_session()
+
+    memory, requests, latency, connections = [], [], [], []
+    day_latency: list[float] = []
+    day_start_requests = 0
+    probes = 0
+    current_day = clock.now().date()
+
+    async def probe() -> None:
+        # Same path as the CLI: EnergiekAPI opens and closes its own session.
+        async with EnergiekAPI() as api:
+            await api.login("cli@mail.com", "pw")
+            owned = api.session
+            assert owned is not shared
+        assert owned.closed
+        assert api.session is None
+
+    tracemalloc.start()
+    try:
+        with (
+            patch.object(dt, "utcnow", clock.utcnow),
+            patch.object(dt, "now", clock.now),
+            energiek_at(server.base_url),
+            patch("custom_components.energiek.async_get_clientsession", return_value=shared),
+            patch("custom_components.energiek.config_flow.async_get_clientsession", return_value=shared),
+            patch.object(energiek_api, "create_session", local_session),
+        ):
+            result = await hass.config_entries.flow.async_init(
+                const.DOMAIN, context={"source": config_entries.SOURCE_USER}
+            )
+            result = await hass.config_entries.flow.async_configure(
+                result["flow_id"],
+                {const.CONF_EMAIL: "test@mail.com", const.CONF_PASSWORD: "pw"},
+            )
+            assert result["type"] == FlowResultType.CREATE_ENTRY
+            await hass.async_block_till_done()
+            entry = result["result"]
+            assert entry.state is config_entries.ConfigEntryState.LOADED
+            data = hass.data[const.DOMAIN][entry.entry_id]
+            coordinator = data[const.DATA_COORDINATOR]
+            assert data[const.DATA_API].session is shared
+
+            while clock.now() < start + timedelta(days=SOAK_DAYS):
+                now = clock.now()
+                began = time.perf_counter()
+                await coordinator.async_refresh()
+                day_latency.append(time.perf_counter() - began)
+
+                if server.in_outage(clock.utcnow()):
+                    assert not coordinator.last_update_success
+                else:
+                    assert coordinator.last_update_success, now
+                    tomorrow = now.date() + timedelta(days=1)
+                    available = server.published(tomorrow)
+                    assert coordinator.data["tomorrow_available"] == available, now
+                    prices = coordinator.data["electricity"].prices
+                    assert len(prices) == day_slots(now.date()) + (day_slots(tomorrow) if available else 0)
+                    assert len({p["from"] for p in prices}) == len(prices)
+                    assert coordinator.data["electricity"].current_price is not None
+
+                connections.append(server.open_connections())
+                clock.advance(REFRESH_INTERVAL)
+
+                if clock.now().date() != current_day:
+                    current_day = clock.now().date()
+                    if not server.in_outage(clock.utcnow()):
+                        await probe()
+                        probes += 1
+                    memory.append(tracked_memory())
+                    requests.append(server.requests - day_start_requests)
+                    latency.append(statistics.median(day_latency))
+                    day_start_requests = server.requests
+                    day_latency = []
+
+            assert await hass.config_entries.async_unload(entry.entry_id)
+    finally:
+        tracemalloc.stop()
+        closed_on_unload = shared.closed
+        await shared.close()
+        await server.server.close()
+
+    # Unloading must leave the shared session to Home Assistant.
+    assert not closed_on_unload
+    assert max(connections) <= CONNECTION_LIMIT
+    # Config flow and setup each log in once, plus one login per expired
+    # session and per probe; outages and XSRF rotation must not force more.
+    assert server.logins == 2 + SOAK_DAYS // SESSION_TTL.days + probes
+    assert slope(memory[WARMUP_DAYS:]) < MAX_MEMORY_SLOPE, memory
+    assert slope(requests[WARMUP_DAYS:]) < MAX_REQUEST_SLOPE, requests
+    week = len(latency) // 2
+    assert statistics.median(latency[week:]) < 2 * statistics.median(latency[:week]) + 0.005, latency
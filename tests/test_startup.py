@@ -0,0 +1,116 @@
+import ast
+import asyncio
+import os
+import subprocess
+import sys
+import time
+from typing import NamedTuple
+from unittest.mock import AsyncMock
+
+import pytest
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from .utils import generate_prices_response
+
+pytestmark = pytest.mark.usefixtures("enable_custom_integrations")
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# Self time of all integration modules together, excluding their dependencies.
+IMPORT_BUDGET_US = 50_000
+# Fake latency per API call; setup does one login and one round of price requests.
+API_LATENCY = 0.25
+SETUP_BUDGET = 4 * API_LATENCY
+
+
+class ImportEntry(NamedTuple):
+    name: str
+    self_us: int
+    cumulative_us: int
+
+
+def parse_importtime(stderr: str) -> list[ImportEntry]:
+    """Parse `python -X importtime` output."""
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        entries.append(
+            ImportEntry(
+                name.strip(),
+                int(self_us),
+                int(cumulative_us),
+            )
+        )
+    return entries
+
+
+def module_imports(path: str) -> set[str]:
+    """Return the top-level names of all absolute imports in a source file."""
+    with open(path, encoding="utf-8") as file:
+        tree = ast.parse(file.read())
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names |= {alias.name.split(".")[0] for alias in node.names}
+        elif isinstance(node, ast.ImportFrom) and node.level == 0:
+            names.add(node.module.split(".")[0])
+    return names
+
+
+def test_import_budget():
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import custom_components.energiek"],
+        cwd=ROOT_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    entries = parse_importtime(result.stderr)
+    ours = [e for e in entries if e.name.startswith("custom_components.energiek")]
+    names = {e.name for e in ours}
+
+    assert "custom_components.energiek.energiek_api" in names
+    assert sum(e.self_us for e in ours) < IMPORT_BUDGET_US, ours
+    # Home Assistant has already loaded these, so importtime cannot tell
+    # whether the API module imports them; check its source instead.
+    assert not {"argparse", "json", "asyncio"} & module_imports(
+        os.path.join(ROOT_DIR, "custom_components", "energiek", "energiek_api.py")
+    )
+
+
+def test_cli_help():
+    result = subprocess.run(
+        [sys.executable, os.path.join("scripts", "energiek_cli.py"), "--help"],
+        cwd=ROOT_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert "Energiek API CLI" in result.stdout
+
+
+async def test_setup_budget(
+    mock_energiek_api: AsyncMock,
+    energiek_config_entry: MockConfigEntry,
+    hass: HomeAssistant,
+):
+    async def login(email, password):
+        await asyncio.sleep(API_LATENCY)
+
+    async def get_prices(date_str, segment):
+        await asyncio.sleep(API_LATENCY)
+        return generate_prices_response(0.2)
+
+    mock_energiek_api.login.side_effect = login
+    mock_energiek_api.get_market_prices.side_effect = get_prices
+
+    started = time.monotonic()
+    assert await hass.config_entries.async_setup(energiek_config_entry.entry_id)
+    await hass.async_block_till_done()
+    elapsed = time.monotonic() - started
+
+    assert mock_energiek_api.get_market_prices.await_count == 4
+    assert elapsed < SETUP_BUDGET, "setup took %.3fs" % elapsed
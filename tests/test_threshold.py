@@ -0,0 +1,150 @@
+from datetime import datetime
+from unittest.mock import AsyncMock
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_capture_events,
+    async_fire_time_changed,
+)
+
+from custom_components.energiek import const
+
+from .utils import generate_prices_response
+
+pytestmark = pytest.mark.usefixtures("enable_custom_integrations", "amsterdam")
+
+ENTITY_ID = "binary_sensor.electricity_price_below_threshold"
+
+
+@pytest.fixture
+def entry_options():
+    return {const.CONF_PRICE_THRESHOLD: 0.25}
+
+
+async def mock_get_prices(date_str, segment):
+    base = 0.2 if segment == "ELECTRICITY" else 1.2
+    if date_str == "2023-01-02":
+        base += 0.1
+    return generate_prices_response(base)
+
+
+async def test_threshold_timers(
+    mock_energiek_api: AsyncMock,
+    energiek_config_entry: MockConfigEntry,
+    hass: HomeAssistant,
+    freezer,
+):
+    tz = dt.get_default_time_zone()
+    freezer.move_to(datetime(2023, 1, 1, 12, 20, tzinfo=tz))
+    mock_energiek_api.get_market_prices.side_effect = mock_get_prices
+
+    await hass.config_entries.async_setup(energiek_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    events = async_capture_events(hass, const.EVENT_PRICE_THRESHOLD)
+    calls = mock_energiek_api.get_market_prices.await_count
+
+    # 12:15 slot is 0.29, so the price is currently above the threshold.
+    assert hass.states.get(ENTITY_ID).state == "off"
+
+    just_before = datetime(2023, 1, 1, 12, 29, 59, tzinfo=tz)
+    freezer.move_to(just_before)
+    async_fire_time_changed(hass, just_before)
+    await hass.async_block_till_done()
+    assert events == []
+
+    # 12:30 slot drops to 0.20.
+    crossing = datetime(2023, 1, 1, 12, 30, tzinfo=tz)
+    freezer.move_to(crossing)
+    async_fire_time_changed(hass, crossing)
+    await hass.async_block_till_done()
+
+    assert len(events) == 1
+    assert events[0].data["direction"] == "below"
+    assert events[0].data["price"] == 0.2
+    assert events[0].data["from"] == dt.as_utc(crossing).isoformat()
+    assert hass.states.get(ENTITY_ID).state == "on"
+    assert mock_energiek_api.get_market_prices.await_count == calls
+
+    # 13:45 slot rises to 0.25 again.
+    crossing = datetime(2023, 1, 1, 13, 45, tzinfo=tz)
+    freezer.move_to(crossing)
+    async_fire_time_changed(hass, crossing)
+    await hass.async_block_till_done()
+
+    assert [e.data["direction"] for e in events] == ["below", "above"]
+    assert hass.states.get(ENTITY_ID).state == "off"
+
+
+async def test_threshold_schedule_is_incremental(
+    mock_energiek_api: AsyncMock,
+    energiek_config_entry: MockConfigEntry,
+    hass: HomeAssistant,
+    freezer,
+):
+    freezer.move_to(datetime(2023, 1, 1, 12, 20, tzinfo=dt.get_default_time_zone()))
+    mock_energiek_api.get_market_prices.side_effect = mock_get_prices
+
+    await hass.config_entries.async_setup(energiek_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    data = hass.data[const.DOMAIN][energiek_config_entry.entry_id]
+    scheduler = data[const.DATA_THRESHOLD]
+    before = dict(scheduler._scheduled)
+    assert before
+
+    await data[const.DATA_COORDINATOR].async_refresh()
+    assert scheduler._scheduled == before
+
+    # A changed curve only replaces the timers that moved.
+    async def shifted(date_str, segment):
+        response = await mock_get_prices(date_str, segment)
+        if date_str == "2023-01-02" and segment == "ELECTRICITY":
+            response["withTotalVat"]["series"][0] = 0.1
+        return response
+
+    mock_energiek_api.get_market_prices.side_effect = shifted
+    await data[const.DATA_COORDINATOR].async_refresh()
+
+    kept = set(before) & set(scheduler._scheduled)
+    assert kept == set(before)
+    assert all(scheduler._scheduled[key] is before[key] for key in kept)
+    assert len(scheduler._scheduled) == len(before) + 2
+
+    await hass.config_entries.async_unload(energiek_config_entry.entry_id)
+    assert scheduler._scheduled == {}
+
+
+async def test_refresh_at_crossing_keeps_due_timer(
+    mock_energiek_api: AsyncMock,
+    energiek_config_entry: MockConfigEntry,
+    hass: HomeAssistant,
+    freezer,
+):
+    tz = dt.get_default_time_zone()
+    freezer.move_to(datetime(2023, 1, 1, 12, 20, tzinfo=tz))
+    mock_energiek_api.get_market_prices.side_effect = mock_get_prices
+
+    await hass.config_entries.async_setup(energiek_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    events = async_capture_events(hass, const.EVENT_PRICE_THRESHOLD)
+    scheduler = hass.data[const.DOMAIN][energiek_config_entry.entry_id][const.DATA_THRESHOLD]
+    crossing = datetime(2023, 1, 1, 12, 30, tzinfo=tz)
+    key = (dt.as_utc(crossing), True, 0.2)
+    assert key in scheduler._scheduled
+
+    # The rebuild runs at the crossing instant, before its timer callback.
+    freezer.move_to(crossing)
+    scheduler.async_update()
+    assert key in scheduler._scheduled
+
+    async_fire_time_changed(hass, crossing)
+    await hass.async_block_till_done()
+
+    assert [e.data["direction"] for e in events] == ["below"]
+    assert key not in scheduler._scheduled
+    assert hass.states.get(ENTITY_ID).state == "on"
@@ -1 +1,195 @@
 """Utils for tests."""
+import uuid
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from unittest.mock import patch
+
+import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from homeassistant.util import dt
+
+from custom_components.energiek.energiek_api import EnergiekAPI, create_session
+
+SESSION_TTL = timedelta(days=3)
+PUBLISH_HOUR = 13
+
+
+def generate_prices_response(base_price):
+    return {
+        "withTotalVat": {
+            "series": [round(base_price + (i % 10) * 0.01, 3) for i in range(96)],
+            "labels": [
+                {
+                    "label": "{:02d}:{:02d}".format(i // 4, (i % 4) * 15)
+                }
+                for i in range(96)
+            ],
+        }
+    }
+
+
+class FakeClock:
+    def __init__(self, start: datetime):
+        self.current = dt.as_utc(start)
+
+    def utcnow(self) -> datetime:
+        return self.current
+
+    def now(self, time_zone=None) -> datetime:
+        return self.current.astimezone(time_zone or dt.get_default_time_zone())
+
+    def advance(self, delta: timedelta) -> None:
+        self.current += delta
+
+
+class FakeEnergiekServer:
+    """Minimal stand-in for the Energiek backend."""
+
+    def __init__(
+        self,
+        clock: FakeClock,
+        outages: list[tuple[datetime, datetime]],
+        publish_delays: dict[date, timedelta],
+    ):
+        self.clock = clock
+        self.outages = outages
+        self.publish_delays = publish_delays
+        self.requests = 0
+        self.logins = 0
+        self.sessions: dict[str, datetime] = {}
+        self.xsrf_tokens: dict[str, date] = {}
+        self._transports = {}
+        app = web.Application(middlewares=[self._middleware])
+        app.router.add_get("/api/auth/csrf", self._csrf)
+        app.router.add_post("/api/auth/prelogin", self._prelogin)
+        app.router.add_post("/api/auth/login", self._login)
+        app.router.add_get("/api/dashboard/marketprice", self._marketprice)
+        self.server = TestServer(app, host="127.0.0.1")
+
+    @property
+    def base_url(self) -> str:
+        return str(self.server.make_url("")).rstrip("/")
+
+    def open_connections(self) -> int:
+        self._transports = {
+            peer: transport
+            for peer, transport in self._transports.items()
+            if not transport.is_closing()
+        }
+        return len(self._transports)
+
+    def in_outage(self, when: datetime) -> bool:
+        return any(start <= when < end for start, end in self.outages)
+
+    def published(self, day: date) -> bool:
+        today = self.clock.now().date()
+        if day <= today:
+            return True
+        if day > today + timedelta(days=1):
+            return False
+        publish_at = datetime(
+            today.year, today.month, today.day, PUBLISH_HOUR, tzinfo=dt.get_default_time_zone()
+        ) + self.publish_delays.get(day, timedelta())
+        return self.clock.now() >= publish_at
+
+    def _xsrf_valid(self, token: str | None) -> bool:
+        # Rotated tokens stay valid for a day, for requests already in flight.
+        issued = self.xsrf_tokens.get(token)
+        return issued is not None and issued >= self.clock.now().date() - timedelta(days=1)
+
+    def _rotate_xsrf(self, response: web.StreamResponse) -> None:
+        today = self.clock.now().date()
+        self.xsrf_tokens = {
+            token: issued
+            for token, issued in self.xsrf_tokens.items()
+            if issued >= today - timedelta(days=1)
+        }
+        token = uuid.uuid4().hex
+        self.xsrf_tokens[token] = today
+        response.set_cookie("XSRF-TOKEN", token)
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler):
+        self.requests += 1
+        self._transports[request.transport.get_extra_info("peername")] = request.transport
+        if self.in_outage(self.clock.utcnow()):
+            return web.Response(status=503, text="Service Unavailable")
+        if request.path == "/api/auth/csrf":
+            return await handler(request)
+        token = request.headers.get("X-XSRF-TOKEN")
+        if not self._xsrf_valid(token):
+            return web.Response(status=403, text="Invalid XSRF token")
+        response = await handler(request)
+        # Each client gets a fresh token on its first request of the day.
+        if response.status < 400 and self.xsrf_tokens[token] != self.clock.now().date():
+            self._rotate_xsrf(response)
+        return response
+
+    async def _csrf(self, request: web.Request) -> web.Response:
+        response = web.Response(status=204)
+        self._rotate_xsrf(response)
+        return response
+
+    async def _prelogin(self, request: web.Request) -> web.Response:
+        return web.json_response({})
+
+    async def _login(self, request: web.Request) -> web.Response:
+        self.logins += 1
+        now = self.clock.utcnow()
+        self.sessions = {sid: expiry for sid, expiry in self.sessions.items() if expiry > now}
+        session_id = uuid.uuid4().hex
+        self.sessions[session_id] = now + SESSION_TTL
+        response = web.json_response(
+            {"organizations": [{"uuid": "org", "clusters": [{"cluster": "cluster"}]}]}
+        )
+        response.set_cookie("SESSION", session_id)
+        return response
+
+    async def _marketprice(self, request: web.Request) -> web.Response:
+        expiry = self.sessions.get(request.cookies.get("SESSION"))
+        if expiry is None or expiry <= self.clock.utcnow():
+            return web.Response(status=401, text="Unauthorized")
+
+        day = datetime.strptime(request.query["date"], "%Y-%m-%d").date()
+        if not self.published(day):
+            return web.Response(status=422, text="Geen marktprijs gevonden")
+
+        base = 0.2 if request.query["marketSegment"] == "ELECTRICITY" else 1.2
+        start = dt.as_utc(dt.start_of_local_day(day))
+        slots = day_slots(day)
+        return web.json_response(
+            {
+                "withTotalVat": {
+                    "series": [round(base + (i % 10) * 0.01, 3) for i in range(slots)],
+                    "labels": [
+                        {"label": dt.as_local(start + timedelta(minutes=15 * i)).strftime("%H:%M")}
+                        for i in range(slots)
+                    ],
+                }
+            }
+        )
+
+
+def day_slots(day: date) -> int:
+    start = dt.as_utc(dt.start_of_local_day(day))
+    end = dt.as_utc(dt.start_of_local_day(day + timedelta(days=1)))
+    return (end - start) // timedelta(minutes=15)
+
+
+def local_session() -> aiohttp.ClientSession:
+    """Return the integration's session with cookies allowed for 127.0.0.1."""
+    return create_session(cookie_jar=aiohttp.CookieJar(unsafe=True))
+
+
+@contextmanager
+def energiek_at(base_url: str):
+    """Point every EnergiekAPI created inside the block at `base_url`."""
+    init = EnergiekAPI.__init__
+
+    def _init(self, session=None):
+        init(self, session)
+        self.base_url = base_url
+
+    with patch.object(EnergiekAPI, "__init__", _init):
+        yield